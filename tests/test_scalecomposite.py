@@ -16,13 +16,49 @@
 
 import unittest
 
+from collections import namedtuple
+from numbers import Number
+
+import numpy as np
+
 import dimod.testing as dtest
 from dimod import ExactSolver, ScaleComposite, HigherOrderComposite, \
     BinaryQuadraticModel, Sampler, PolySampler
 from dimod.reference.composites.scalecomposite import _check_params, _scaled_bqm, _calc_norm_coeff
 
 
-from numbers import Number
+_EMPTY_VARS, _EMPTY_INTS = map(frozenset, _check_params(None, None))
+
+_HuboSoA = namedtuple('_HuboSoA', ['term_keys', 'bias_values', 'ignored_mask'])
+
+
+def _to_soa(mapping, ignored):
+    """Split a bias mapping into parallel keys, biases and ignored mask.
+
+    Biases are assumed to be floats and are stored as float64.
+    """
+    term_keys = tuple(mapping)
+    bias_values = np.fromiter((mapping[k] for k in term_keys),
+                              dtype=np.float64, count=len(term_keys))
+    ignored_mask = np.fromiter((k in ignored for k in term_keys),
+                               dtype=bool, count=len(term_keys))
+    return _HuboSoA(term_keys, bias_values, ignored_mask)
+
+
+def _from_soa(soa):
+    """Rebuild the bias mapping from a _HuboSoA, with float biases"""
+    return dict(zip(soa.term_keys, soa.bias_values.tolist()))
+
+
+def _scale_masked(values, mask, scalar):
+    """Scale the values not flagged in mask by scalar"""
+    return np.where(mask, values, values * scalar)
+
+
+def _scale_soa(soa, scalar):
+    """Scale the biases of a _HuboSoA that are not ignored"""
+    return soa._replace(bias_values=_scale_masked(soa.bias_values,
+                                                  soa.ignored_mask, scalar))
 
 
 def _scaled_hubo(h, j, offset, scalar, bias_range,
@@ -32,38 +68,93 @@ def _scaled_hubo(h, j, offset, scalar, bias_range,
                  ignore_offset):
     """Helper function of sample_ising for scaling"""
 
+    ignored_variables = frozenset() if ignored_variables is None \
+        else frozenset(ignored_variables)
+    ignored_interactions = frozenset() if ignored_interactions is None \
+        else frozenset(ignored_interactions)
+
     if scalar is None:
         scalar = _calc_norm_coeff(h, j, bias_range, quadratic_range,
                                   ignored_variables, ignored_interactions)
-    h_sc = dict(h)
-    j_sc = dict(j)
-    offset_sc = offset
     if not isinstance(scalar, Number):
         raise TypeError("expected scalar to be a Number")
 
-    if scalar != 1:
-        if ignored_variables is None or ignored_interactions is None:
-            raise ValueError('ignored interactions or variables cannot be None')
-        j_sc = {}
-        for u, v in j.items():
-            if u in ignored_interactions:
-                j_sc[u] = v
-            else:
-                j_sc[u] = v * scalar
+    if scalar == 1:
+        # nothing to scale; callers treat the biases as read-only so the
+        # inputs can be handed back without copying
+        return h, j, offset
 
-        if not ignore_offset:
-            offset_sc = offset * scalar
+    h_sc = _from_soa(_scale_soa(_to_soa(h, ignored_variables), scalar))
+    j_sc = _from_soa(_scale_soa(_to_soa(j, ignored_interactions), scalar))
 
-        h_sc = {}
-        for k, v in h.items():
-            if k in ignored_variables:
-                h_sc[k] = v
-            else:
-                h_sc[k] = v * scalar
+    offset_sc = offset if ignore_offset else offset * scalar
 
     return h_sc, j_sc, offset_sc
 
 
+def _ref_scale(mapping, sc, ignored):
+    """Expected result of dividing the biases not in ignored by sc"""
+    keys = list(mapping)
+    vals = np.fromiter((mapping[k] for k in keys), dtype=np.float64,
+                       count=len(keys))
+    mask = np.fromiter((k in ignored for k in keys), dtype=bool,
+                       count=len(keys))
+    return dict(zip(keys, np.where(mask, vals, vals / sc).tolist()))
+
+
+_ScalingCase = namedtuple('_ScalingCase', ['bias_range', 'quadratic_range',
+                                           'ignored_variables',
+                                           'ignored_interactions',
+                                           'ignore_offset', 'offset', 'sc'])
+
+
+def _expected_and_scaled_bqm(linear, quadratic, case):
+    """Expected and actual scaled bqm for a _ScalingCase"""
+    ignored_variables, ignored_interactions = _check_params(
+        case.ignored_variables, case.ignored_interactions)
+
+    bqm = BinaryQuadraticModel.from_ising(linear, quadratic,
+                                          offset=case.offset)
+    bqm_new = _scaled_bqm(bqm, None, case.bias_range, case.quadratic_range,
+                          ignored_variables, ignored_interactions,
+                          case.ignore_offset)
+
+    offset = case.offset if case.ignore_offset else case.offset / case.sc
+    bqm_scaled = BinaryQuadraticModel.from_ising(
+        _ref_scale(linear, case.sc, ignored_variables),
+        _ref_scale(quadratic, case.sc, ignored_interactions),
+        offset=offset)
+
+    return bqm_scaled, bqm_new
+
+
+def _expected_and_scaled_hubo(linear, quadratic, case):
+    """Expected and actual scaled (h, J, offset) for a _ScalingCase"""
+    ignored_variables, ignored_interactions = _check_params(
+        case.ignored_variables, case.ignored_interactions)
+
+    scaled = _scaled_hubo(linear, quadratic, case.offset, None,
+                          case.bias_range, case.quadratic_range,
+                          ignored_variables, ignored_interactions,
+                          case.ignore_offset)
+
+    offset = case.offset if case.ignore_offset else case.offset / case.sc
+    expected = (_ref_scale(linear, case.sc, ignored_variables),
+                _ref_scale(quadratic, case.sc, ignored_interactions),
+                offset)
+
+    return expected, scaled
+
+
+def _bqm_fingerprint(bqm):
+    """Hashable summary of the vartype, biases and offset of a bqm"""
+    return (bqm.vartype,
+            frozenset(bqm.linear.items()),
+            frozenset((frozenset(interaction), bias)
+                      for interaction, bias in bqm.quadratic.items()),
+            bqm.offset)
+
+
 class ScalingChecker(Sampler, PolySampler):
     def __init__(self, child_sampler, bqm=None, h=None, J=None, offset=0,
                  scalar=None, bias_range=1, quadratic_range=None,
@@ -80,20 +171,24 @@ class ScalingChecker(Sampler, PolySampler):
 
         if bqm is not None:
             self.bqm = _scaled_bqm(bqm, **scale_options)
+            self._bqm_fingerprint = _bqm_fingerprint(self.bqm)
 
         elif h is not None and J is not None:
-            if max(map(len, J.keys())) == 2:
+            if not any(len(term) > 2 for term in J):
                 bqm = BinaryQuadraticModel.from_ising(h, J, offset=offset)
                 self.bqm = _scaled_bqm(bqm, **scale_options)
+                self._bqm_fingerprint = _bqm_fingerprint(self.bqm)
             else:
                 h_sc, J_sc, offset_sc = _scaled_hubo(h, J, offset=offset,
                                                      **scale_options)
                 self.h = h_sc
                 self.J = J_sc
+                self._J_frozen = {frozenset(term): bias
+                                  for term, bias in J_sc.items()}
                 self.offset = offset_sc
 
     def sample(self, bqm, **parameters):
-        assert self.bqm == bqm
+        assert self._bqm_fingerprint == _bqm_fingerprint(bqm)
         return self.child.sample(bqm, **parameters)
 
     def sample_ising(self, h, J, offset=0, **parameters):
@@ -105,9 +200,9 @@ class ScalingChecker(Sampler, PolySampler):
     def sample_poly(self, poly, **parameters):
         h, J, offset = poly.to_hising()
         assert self.h == h
-        selfJ = {frozenset(term): bias for term, bias in self.J.items()}
-        J = {frozenset(term): bias for term, bias in J.items()}
-        assert selfJ == J
+        assert len(self._J_frozen) == len(J)
+        for term, bias in J.items():
+            assert self._J_frozen.get(frozenset(term)) == bias
         assert self.offset == offset
         return self.child.sample_poly(poly, **parameters)
 
@@ -120,365 +215,239 @@ class ScalingChecker(Sampler, PolySampler):
 
 class TestScaleComposite(unittest.TestCase):
 
-    def test_instantiation_smoketest(self):
-        sampler = ScaleComposite(ExactSolver())
-        dtest.assert_sampler_api(sampler)
-
-    def test_scaling_bqm(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic, offset=5.0)
-        scalar = None
-        quadratic_range = None
-        ignore_offset = False
-        bqm_new = _scaled_bqm(bqm, scalar, 2, quadratic_range,
-                              ignored_variables, ignored_interactions,
-                              ignore_offset)
-
-        sc = 2.
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
-        bqm_scaled = BinaryQuadraticModel.from_ising(hsc, Jsc, offset=5.0 / 2.)
-        self.assertEqual(bqm_scaled, bqm_new)
-
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic, offset=5.0)
-        bqm_new = _scaled_bqm(bqm, scalar, 2, quadratic_range,
-                              ignored_variables, ignored_interactions,
-                              True)
-
-        sc = 2.
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
-        bqm_scaled = BinaryQuadraticModel.from_ising(hsc, Jsc, offset=5.0)
-        self.assertEqual(bqm_scaled, bqm_new)
-
-        bqm_new = _scaled_bqm(bqm, scalar, 1, (-1, 0.4),
-                              ignored_variables, ignored_interactions,
-                              ignore_offset)
-
-        sc = 3.2 / 0.4
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
-
-        bqm_scaled = BinaryQuadraticModel.from_ising(hsc, Jsc, offset=5.0 / sc)
-        self.assertEqual(bqm_scaled, bqm_new)
-
-        ignored_variables = ['a', 'b']
-        ignored_interactions = None
-        ignored_variables, ignored_interactions = _check_params(
-            ignored_variables, ignored_interactions)
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic)
+    @classmethod
+    def setUpClass(cls):
+        cls.linear = {'a': -4.0, 'b': -4.0}
+        cls.quadratic = {('a', 'b'): 3.2}
+        cls.offset = 5
+        cls.bqm = BinaryQuadraticModel.from_ising(cls.linear, cls.quadratic,
+                                                  offset=cls.offset)
 
-        bqm_new = _scaled_bqm(bqm, scalar, (2, 2), quadratic_range,
-                              ignored_variables, ignored_interactions,
-                              ignore_offset)
+        cls.hubo_linear = {'a': -4.0, 'b': -4.0, 'c': -4.0}
+        cls.hubo_quadratic = {('a', 'b', 'c'): 3.2}
 
-        sc = 3.2 / 2.
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
+        cls.exact = ExactSolver()
+        cls.hoc = HigherOrderComposite(cls.exact)
 
-        bqm_scaled = BinaryQuadraticModel.from_ising(hsc, Jsc, offset=0)
-        self.assertEqual(bqm_scaled, bqm_new)
-
-        ignored_variables = None
-        ignored_interactions = [('a', 'b')]
-        ignored_variables, ignored_interactions = _check_params(
-            ignored_variables, ignored_interactions)
-
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic)
-        bqm_new = _scaled_bqm(bqm, scalar, 1, 0.5,
-                              ignored_variables, ignored_interactions,
-                              ignore_offset)
-
-        sc = 4.
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
+    def test_instantiation_smoketest(self):
+        sampler = ScaleComposite(self.exact)
+        dtest.assert_sampler_api(sampler)
 
-        bqm_scaled = BinaryQuadraticModel.from_ising(hsc, Jsc, offset=0)
-        self.assertEqual(bqm_scaled, bqm_new)
+    def test_scaling_bqm(self):
+        cases = [_ScalingCase(bias_range=2, quadratic_range=None,
+                              ignored_variables=None,
+                              ignored_interactions=None,
+                              ignore_offset=False, offset=5.0, sc=2.),
+                 _ScalingCase(bias_range=2, quadratic_range=None,
+                              ignored_variables=None,
+                              ignored_interactions=None,
+                              ignore_offset=True, offset=5.0, sc=2.),
+                 _ScalingCase(bias_range=1, quadratic_range=(-1, 0.4),
+                              ignored_variables=None,
+                              ignored_interactions=None,
+                              ignore_offset=False, offset=5.0, sc=3.2 / 0.4),
+                 _ScalingCase(bias_range=(2, 2), quadratic_range=None,
+                              ignored_variables=['a', 'b'],
+                              ignored_interactions=None,
+                              ignore_offset=False, offset=0, sc=3.2 / 2.),
+                 _ScalingCase(bias_range=1, quadratic_range=0.5,
+                              ignored_variables=None,
+                              ignored_interactions=[('a', 'b')],
+                              ignore_offset=False, offset=0, sc=4.)]
+
+        for case in cases:
+            bqm_scaled, bqm_new = _expected_and_scaled_bqm(self.linear,
+                                                           self.quadratic,
+                                                           case)
+            self.assertEqual(bqm_scaled, bqm_new, msg=str(case))
 
     def test_scaling_hubo(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b', 'c'): 3.2}
-        offset = 5
-        ignored_variables = None
-        ignored_interactions = None
-        ignored_variables, ignored_interactions = _check_params(
-            ignored_variables, ignored_interactions)
-
-        hnew, jnew, offsetnew = _scaled_hubo(linear, quadratic, offset,
-                                             None, 2, None, ignored_variables,
-                                             ignored_interactions, False)
-
-        sc = 2.
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        self.assertEqual(hsc, hnew)
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
-        self.assertEqual(Jsc, jnew)
-        self.assertEqual(offsetnew, offset / sc)
-
-        hnew, jnew, offsetnew = _scaled_hubo(linear, quadratic, offset,
-                                             None, 2, None, ignored_variables,
-                                             ignored_interactions, True)
-
-        sc = 2.
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        self.assertEqual(hsc, hnew)
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
-        self.assertEqual(Jsc, jnew)
-        self.assertEqual(offsetnew, offset)
-
-        hnew, jnew, offsetnew = _scaled_hubo(linear, quadratic, offset,
-                                             None, 1, (-1, 0.4),
-                                             ignored_variables,
-                                             ignored_interactions, False)
-
-        sc = 3.2 / 0.4
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        self.assertEqual(hsc, hnew)
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
-        self.assertEqual(Jsc, jnew)
-        self.assertEqual(offsetnew, offset / sc)
-
-        ignored_variables = ['a', 'b']
-        ignored_interactions = None
-        ignored_variables, ignored_interactions = _check_params(
-            ignored_variables, ignored_interactions)
-
-        hnew, jnew, offsetnew = _scaled_hubo(linear, quadratic, offset,
-                                             None, (-2, 2), None,
-                                             ignored_variables,
-                                             ignored_interactions, False)
-        sc = 3.2 / 2.
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        self.assertEqual(hsc, hnew)
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
-        self.assertEqual(Jsc, jnew)
-        self.assertEqual(offsetnew, offset / sc)
-
-        ignored_variables = None
-        ignored_interactions = [('a', 'b', 'c')]
-        ignored_variables, ignored_interactions = _check_params(
-            ignored_variables, ignored_interactions)
-
-        hnew, jnew, offsetnew = _scaled_hubo(linear, quadratic, offset,
-                                             None, 1, 0.5, ignored_variables,
-                                             ignored_interactions, False)
-
-        sc = 4.
-        hsc = {k: v / sc if k not in ignored_variables else v for
-               k, v in linear.items()}
-        self.assertEqual(hsc, hnew)
-        Jsc = {k: v / sc if k not in ignored_interactions else v for
-               k, v in quadratic.items()}
-        self.assertEqual(Jsc, jnew)
-        self.assertEqual(offsetnew, offset / sc)
+        linear = self.linear
+        quadratic = self.hubo_quadratic
+        offset = self.offset
+
+        cases = [_ScalingCase(bias_range=2, quadratic_range=None,
+                              ignored_variables=None,
+                              ignored_interactions=None,
+                              ignore_offset=False, offset=offset, sc=2.),
+                 _ScalingCase(bias_range=2, quadratic_range=None,
+                              ignored_variables=None,
+                              ignored_interactions=None,
+                              ignore_offset=True, offset=offset, sc=2.),
+                 _ScalingCase(bias_range=1, quadratic_range=(-1, 0.4),
+                              ignored_variables=None,
+                              ignored_interactions=None,
+                              ignore_offset=False, offset=offset,
+                              sc=3.2 / 0.4),
+                 _ScalingCase(bias_range=(-2, 2), quadratic_range=None,
+                              ignored_variables=['a', 'b'],
+                              ignored_interactions=None,
+                              ignore_offset=False, offset=offset,
+                              sc=3.2 / 2.),
+                 _ScalingCase(bias_range=1, quadratic_range=0.5,
+                              ignored_variables=None,
+                              ignored_interactions=[('a', 'b', 'c')],
+                              ignore_offset=False, offset=offset, sc=4.)]
+
+        for case in cases:
+            expected, scaled = _expected_and_scaled_hubo(linear, quadratic,
+                                                         case)
+            self.assertEqual(expected, scaled, msg=str(case))
+
+        # a unit scalar hands back the inputs untouched
+        for ignore_offset in (False, True):
+            hnew, jnew, offsetnew = _scaled_hubo(linear, quadratic, offset,
+                                                 1, 2, None, _EMPTY_VARS,
+                                                 _EMPTY_INTS, ignore_offset)
+            self.assertIs(hnew, linear)
+            self.assertIs(jnew, quadratic)
+            self.assertEqual(offsetnew, offset)
 
     def test_sample_hising_nonescale(self):
-        linear = {'a': -4.0, 'b': -4.0, 'c': -4.0}
-        quadratic = {('a', 'b', 'c'): 3.2}
-        offset = 5
-
-        ignored_variables, ignored_interactions = _check_params(None, None)
-
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
                                penalty_strength=5.
                                )
 
         sampler = ScaleComposite(
-            ScalingChecker(HigherOrderComposite(ExactSolver()),
-                           h=linear,
-                           J=quadratic, offset=offset,
+            ScalingChecker(self.hoc,
+                           h=self.hubo_linear,
+                           J=self.hubo_quadratic, offset=self.offset,
                            **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.hubo_linear,
+                                        self.hubo_quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
 
         self.assertAlmostEqual(response.first.energy, -3.8)
 
     def test_sample_hising_bias_range(self):
-        linear = {'a': -4.0, 'b': -4.0, 'c': -4.0}
-        quadratic = {('a', 'b', 'c'): 3.2}
-        offset = 5
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
                                penalty_strength=5.,
                                bias_range=2)
         sampler = ScaleComposite(
-            ScalingChecker(HigherOrderComposite(ExactSolver()),
-                           h=linear,
-                           J=quadratic, offset=offset,
+            ScalingChecker(self.hoc,
+                           h=self.hubo_linear,
+                           J=self.hubo_quadratic, offset=self.offset,
                            **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.hubo_linear,
+                                        self.hubo_quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
 
         self.assertAlmostEqual(response.first.energy, -3.8)
 
     def test_sample_hising_quadratic_range(self):
-        linear = {'a': -4.0, 'b': -4.0, 'c': -4.0}
-        quadratic = {('a', 'b', 'c'): 3.2}
-        offset = 5
-        ignored_variables, ignored_interactions = _check_params(None, None)
+        for quadratic_range in [(-1, 2), (-1, 0.4)]:
+            comp_parameters = dict(
+                ignored_interactions=_EMPTY_INTS,
+                ignored_variables=_EMPTY_VARS,
+                penalty_strength=5.,
+                quadratic_range=quadratic_range)
+            sampler = ScaleComposite(
+                ScalingChecker(self.hoc,
+                               h=self.hubo_linear,
+                               J=self.hubo_quadratic, offset=self.offset,
+                               **comp_parameters))
+            response = sampler.sample_ising(self.hubo_linear,
+                                            self.hubo_quadratic,
+                                            offset=self.offset,
+                                            **comp_parameters)
+
+            self.assertAlmostEqual(response.first.energy, -3.8,
+                                   msg=str(quadratic_range))
 
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
-                               penalty_strength=5.,
-                               quadratic_range=(-1, 2)
-                               )
-        sampler = ScaleComposite(
-            ScalingChecker(HigherOrderComposite(ExactSolver()),
-                           h=linear,
-                           J=quadratic, offset=offset,
-                           **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
-                                        **comp_parameters)
-
-        self.assertAlmostEqual(response.first.energy, -3.8)
-
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
+    def test_sample_hising_ranges(self):
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
                                penalty_strength=5.,
-                               quadratic_range=(-1, 0.4)
+                               quadratic_range=(-1, 10),
+                               bias_range=(-8.0, 5)
                                )
         sampler = ScaleComposite(
-            ScalingChecker(HigherOrderComposite(ExactSolver()),
-                           h=linear,
-                           J=quadratic, offset=offset,
+            ScalingChecker(self.hoc,
+                           h=self.hubo_linear,
+                           J=self.hubo_quadratic, offset=self.offset,
                            **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.hubo_linear,
+                                        self.hubo_quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
 
         self.assertAlmostEqual(response.first.energy, -3.8)
 
-    def test_sample_hising_ranges(self):
-        linear = {'a': -4.0, 'b': -4.0, 'c': -4.0}
-        quadratic = {('a', 'b', 'c'): 3.2}
-        offset = 5
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
-                               penalty_strength=5.,
-                               quadratic_range=(-1, 10),
-                               bias_range=(-8.0, 5)
-                               )
+    def test_sample_hising_mixed_arity(self):
+        quadratic = {('a', 'b'): 1.0, ('a', 'b', 'c'): 3.2}
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
+                               penalty_strength=5.)
         sampler = ScaleComposite(
-            ScalingChecker(HigherOrderComposite(ExactSolver()),
-                           h=linear,
-                           J=quadratic, offset=offset,
+            ScalingChecker(self.hoc,
+                           h=self.hubo_linear,
+                           J=quadratic, offset=self.offset,
                            **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.hubo_linear, quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
 
-        self.assertAlmostEqual(response.first.energy, -3.8)
+        self.assertAlmostEqual(response.first.energy, -3.2)
 
     def test_sample_nonescale(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic, offset=offset)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables)
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS)
 
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), bqm=bqm,
+        sampler = ScaleComposite(ScalingChecker(self.exact, bqm=self.bqm,
                                                 **comp_parameters))
-        response = sampler.sample(bqm, **comp_parameters)
+        response = sampler.sample(self.bqm, **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_bias_range(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
+        bqm = BinaryQuadraticModel.from_ising(self.linear, self.quadratic)
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
                                bias_range=2.
                                )
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), bqm=bqm,
+        sampler = ScaleComposite(ScalingChecker(self.exact, bqm=bqm,
                                                 **comp_parameters))
         response = sampler.sample(bqm, **comp_parameters)
         self.assertAlmostEqual(response.first.energy, -4.8)
 
     def test_sample_quadratic_range(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic, offset=offset)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
-                               quadratic_range=(-1, 2)
-                               )
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), bqm=bqm,
-                                                **comp_parameters))
-        response = sampler.sample(bqm, **comp_parameters)
-        self.assertAlmostEqual(response.first.energy, 0.2)
-
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
-                               quadratic_range=(-1, 0.4)
-                               )
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), bqm=bqm,
-                                                **comp_parameters))
-        response = sampler.sample(bqm, **comp_parameters)
-        self.assertAlmostEqual(response.first.energy, 0.2)
+        for quadratic_range in [(-1, 2), (-1, 0.4)]:
+            comp_parameters = dict(
+                ignored_interactions=_EMPTY_INTS,
+                ignored_variables=_EMPTY_VARS,
+                quadratic_range=quadratic_range)
+            sampler = ScaleComposite(ScalingChecker(self.exact, bqm=self.bqm,
+                                                    **comp_parameters))
+            response = sampler.sample(self.bqm, **comp_parameters)
+            self.assertAlmostEqual(response.first.energy, 0.2,
+                                   msg=str(quadratic_range))
 
     def test_sample_ranges(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic, offset=offset)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
                                quadratic_range=(-1, 10),
                                bias_range=(-8.0, 5)
                                )
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), bqm=bqm,
+        sampler = ScaleComposite(ScalingChecker(self.exact, bqm=self.bqm,
                                                 **comp_parameters))
-        response = sampler.sample(bqm, **comp_parameters)
+        response = sampler.sample(self.bqm, **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_ising_quadratic(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables)
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), h=linear,
-                                                J=quadratic, offset=offset,
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS)
+        sampler = ScaleComposite(ScalingChecker(self.exact, h=self.linear,
+                                                J=self.quadratic,
+                                                offset=self.offset,
                                                 **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic,
-                                        offset=offset)
+        response = sampler.sample_ising(self.linear, self.quadratic,
+                                        offset=self.offset)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_ising_ignore_interaction(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
         ignored_variables, ignored_interactions = _check_params(
             None, [('a', 'b')])
         comp_parameters = dict(ignored_interactions=ignored_interactions,
@@ -486,73 +455,61 @@ class TestScaleComposite(unittest.TestCase):
                                scalar=0.5
                                )
 
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), h=linear,
-                                                J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(self.exact, h=self.linear,
+                                                J=self.quadratic,
+                                                offset=self.offset,
                                                 **comp_parameters))
 
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.linear, self.quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_ising_ignore_offset(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
-
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), h=linear,
-                                                J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(self.exact, h=self.linear,
+                                                J=self.quadratic,
+                                                offset=self.offset,
                                                 **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.linear, self.quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_ignore_offset(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic, offset=offset)
-
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), h=linear,
-                                                J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(self.exact, h=self.linear,
+                                                J=self.quadratic,
+                                                offset=self.offset,
                                                 **comp_parameters))
-        response = sampler.sample(bqm, **comp_parameters)
+        response = sampler.sample(self.bqm, **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_hising_ignore_offset(self):
-        linear = {'a': -4.0, 'b': -4.0, 'c': -4.0}
-        quadratic = {('a', 'b', 'c'): 3.2}
-        offset = 5
-
-        ignored_variables, ignored_interactions = _check_params(None, None)
-        comp_parameters = dict(ignored_interactions=ignored_interactions,
-                               ignored_variables=ignored_variables,
+        comp_parameters = dict(ignored_interactions=_EMPTY_INTS,
+                               ignored_variables=_EMPTY_VARS,
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(HigherOrderComposite(
-            ExactSolver()), h=linear,
-            J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(
+            self.hoc, h=self.hubo_linear,
+            J=self.hubo_quadratic, offset=self.offset,
             **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.hubo_linear,
+                                        self.hubo_quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
         self.assertAlmostEqual(response.first.energy, -3.8)
 
     def test_sample_ising_ignore_interactions(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
         ignored_variables, ignored_interactions = _check_params(
             None, [('a', 'b')])
 
@@ -561,19 +518,16 @@ class TestScaleComposite(unittest.TestCase):
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), h=linear,
-                                                J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(self.exact, h=self.linear,
+                                                J=self.quadratic,
+                                                offset=self.offset,
                                                 **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.linear, self.quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_ignore_interactions(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic, offset=offset)
-
         ignored_variables, ignored_interactions = _check_params(
             None, [('a', 'b')])
         comp_parameters = dict(ignored_interactions=ignored_interactions,
@@ -581,16 +535,14 @@ class TestScaleComposite(unittest.TestCase):
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), h=linear,
-                                                J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(self.exact, h=self.linear,
+                                                J=self.quadratic,
+                                                offset=self.offset,
                                                 **comp_parameters))
-        response = sampler.sample(bqm, **comp_parameters)
+        response = sampler.sample(self.bqm, **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_hising_ignore_interactions(self):
-        linear = {'a': -4.0, 'b': -4.0, 'c': -4.0}
-        quadratic = {('a', 'b', 'c'): 3.2}
-        offset = 5
         ignored_variables, ignored_interactions = _check_params(
             None, [('a', 'b', 'c')])
         comp_parameters = dict(ignored_interactions=ignored_interactions,
@@ -598,18 +550,17 @@ class TestScaleComposite(unittest.TestCase):
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(HigherOrderComposite(
-            ExactSolver()), h=linear,
-            J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(
+            self.hoc, h=self.hubo_linear,
+            J=self.hubo_quadratic, offset=self.offset,
             **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.hubo_linear,
+                                        self.hubo_quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
         self.assertAlmostEqual(response.first.energy, -3.8)
 
     def test_sample_ising_ignore_variables(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
         ignored_variables, ignored_interactions = _check_params(
             ['a'], None)
 
@@ -618,18 +569,16 @@ class TestScaleComposite(unittest.TestCase):
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), h=linear,
-                                                J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(self.exact, h=self.linear,
+                                                J=self.quadratic,
+                                                offset=self.offset,
                                                 **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.linear, self.quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_ignore_variables(self):
-        linear = {'a': -4.0, 'b': -4.0}
-        quadratic = {('a', 'b'): 3.2}
-        offset = 5
-        bqm = BinaryQuadraticModel.from_ising(linear, quadratic, offset=offset)
         ignored_variables, ignored_interactions = _check_params(
             ['a'], None)
         comp_parameters = dict(ignored_interactions=ignored_interactions,
@@ -637,16 +586,14 @@ class TestScaleComposite(unittest.TestCase):
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(ExactSolver(), h=linear,
-                                                J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(self.exact, h=self.linear,
+                                                J=self.quadratic,
+                                                offset=self.offset,
                                                 **comp_parameters))
-        response = sampler.sample(bqm, **comp_parameters)
+        response = sampler.sample(self.bqm, **comp_parameters)
         self.assertAlmostEqual(response.first.energy, 0.2)
 
     def test_sample_hising_ignore_variables(self):
-        linear = {'a': -4.0, 'b': -4.0, 'c': -4.0}
-        quadratic = {('a', 'b', 'c'): 3.2}
-        offset = 5
         ignored_variables, ignored_interactions = _check_params(
             ['a'], None)
         comp_parameters = dict(ignored_interactions=ignored_interactions,
@@ -654,10 +601,12 @@ class TestScaleComposite(unittest.TestCase):
                                ignore_offset=True,
                                scalar=0.5)
 
-        sampler = ScaleComposite(ScalingChecker(HigherOrderComposite(
-            ExactSolver()), h=linear,
-            J=quadratic, offset=offset,
+        sampler = ScaleComposite(ScalingChecker(
+            self.hoc, h=self.hubo_linear,
+            J=self.hubo_quadratic, offset=self.offset,
             **comp_parameters))
-        response = sampler.sample_ising(linear, quadratic, offset=offset,
+        response = sampler.sample_ising(self.hubo_linear,
+                                        self.hubo_quadratic,
+                                        offset=self.offset,
                                         **comp_parameters)
         self.assertAlmostEqual(response.first.energy, -3.8)